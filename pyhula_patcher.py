@@ -6,20 +6,261 @@ Applies permanent fixes to the installed PyHula library
 """
 
 import os
+import re
 import sys
-import shutil
-import importlib.util
+import threading
 from pathlib import Path
 
+# Spans of the methods replaced by the patches: the signature line plus every
+# following line indented deeper than it (blank lines only when more body follows)
+_METHOD_BODY = r'[^\n]*\n(?:(?:[ \t]*\n)*(?P=indent)[ \t]+\S[^\n]*(?:\n|\Z))*'
+_PACK_SIGNATURE = 'def pack(self, force_mavlink1=False):'
+_PACK_METHOD_RE = re.compile(
+    r'^(?P<indent>[ \t]*)' + re.escape(_PACK_SIGNATURE) + _METHOD_BODY, re.MULTILINE)
+_CONNECT_SIGNATURE = 'def connect(self, server_ip="192.168.100.1"):'
+_CONNECT_METHOD_RE = re.compile(
+    r'^(?P<indent>[ \t]*)' + re.escape(_CONNECT_SIGNATURE) + _METHOD_BODY, re.MULTILINE)
+
+# Marker comments left in every patched file
+_SENTINEL_RE = re.compile(r'# PYHULA_(?:PATCH|UDP_PATCH|USERAPI_PATCH)_APPLIED')
+_SENTINEL_BYTES_RE = re.compile(_SENTINEL_RE.pattern.encode('ascii'))
+
+# Replacement for the problematic MAVLink header pack method
+_MAVLINK_PACK_REPLACEMENT = '''def pack(self, force_mavlink1=False):
+    """
+    pack the MAVLink header into a byte string
+    """
+    # PYHULA_PATCH_APPLIED: Fix struct packing with proper integer conversion
+    try:
+        # Ensure all values are proper integers
+        magic = int(self.magic) if hasattr(self, 'magic') else 254
+        length = int(self.length) if hasattr(self, 'length') else 0
+        seq = int(self.seq) if hasattr(self, 'seq') else 0
+        srcSystem = int(self.srcSystem) if hasattr(self, 'srcSystem') else 255
+        srcComponent = int(self.srcComponent) if hasattr(self, 'srcComponent') else 190
+        msgId = int(self.msgId) if hasattr(self, 'msgId') else 0
+
+        return struct.pack('<BBBBBB', magic, length, seq, srcSystem, srcComponent, msgId)
+    except (ValueError, TypeError) as e:
+        # Fallback with default values if conversion fails
+        print(f"MAVLink header pack warning: {e}, using defaults")
+        return struct.pack('<BBBBBB', 254, 0, 0, 255, 190, 0)
+'''
+
+# UDP bind calls on the wildcard address, quoted either way and with any spacing;
+# sock and port name the socket and port expressions used by the call
+_BIND_RE = re.compile(
+    r'''^(?P<indent>[ \t]*)(?P<call>(?P<sock>(?:self\.)?sock)\.bind\(\(\s*(?P<q>['"])(?P=q)\s*,\s*'''
+    r'''(?P<port>self\.listen_port|port)\s*\)\))''',
+    re.MULTILINE)
+
+# Robust wrapper around the UDP bind call, filled from a _BIND_RE match: {call}
+# is the original call, {sock} and {port} let the fallback bind the same socket
+_UDP_BIND_REPLACEMENT = """# PYHULA_UDP_PATCH_APPLIED: Robust UDP binding
+try:
+    {call}
+except OSError as e:
+    if e.winerror == 10049:  # Address not valid
+        # Try binding to localhost instead
+        try:
+            {sock}.bind(('127.0.0.1', {port}))
+            print(f"UDP bound to localhost:{{{port}}} (fallback)")
+        except:
+            # Try any available port
+            {sock}.bind(('127.0.0.1', 0))
+            print(f"UDP bound to localhost:{{{sock}.getsockname()[1]}} (auto-assigned)")
+    else:
+        raise e"""
+
+# Robust replacement for the UserApi connect method
+_USERAPI_CONNECT_REPLACEMENT = '''def connect(self, server_ip="192.168.100.1"):
+    """
+    connect to the drone with robust error handling
+    """
+    # PYHULA_USERAPI_PATCH_APPLIED
+    try:
+        print(f"Connecting to drone at {server_ip}...")
+        result = self._control_server.connect(server_ip)
+        if result:
+            print("✓ Connection established")
+        else:
+            print("✗ Connection failed - no response from drone")
+        return result
+    except Exception as e:
+        print(f"✗ Connection error: {e}")
+        print("Troubleshooting:")
+        print(f"1. Verify drone is at IP: {server_ip}")
+        print("2. Check WiFi connection to drone network")
+        print("3. Ensure drone is powered and in AP mode")
+        return False
+'''
+
+
+def _indent_block(code, indent):
+    """Indent every non-blank line of code by indent"""
+    return ''.join(line if line.isspace() else indent + line
+                   for line in code.splitlines(True))
+
+
+def _replace_method(signature, pattern, replacement, content):
+    """Swap the first method matched by pattern for replacement; None if absent"""
+    # Jump to the signature with a plain substring search, then match the
+    # method span from the start of that line only
+    match = None
+    index = content.find(signature)
+    while index >= 0:
+        match = pattern.match(content, content.rfind('\n', 0, index) + 1)
+        if match:
+            break
+        index = content.find(signature, index + 1)
+    if not match:
+        return None
+    
+    # Splice the replacement between the untouched prefix and suffix in one join
+    return ''.join((content[:match.start()],
+                    _indent_block(replacement, match.group('indent')),
+                    content[match.end():]))
+
+
+def _scan_py_files(directory, relative_dir=''):
+    """Yield (relative path, full path) of every .py file below directory"""
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            relative_path = os.path.join(relative_dir, entry.name)
+            # DirEntry caches the file type, so no extra stat per entry
+            if entry.is_dir(follow_symlinks=False):
+                yield from _scan_py_files(entry.path, relative_path)
+            elif entry.name.endswith('.py'):
+                yield relative_path, entry.path
+
+
+def _lock_file(f):
+    """Take an exclusive lock on an open file so concurrent runs don't race"""
+    try:
+        import msvcrt
+    except ImportError:
+        import fcntl
+        fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+        return
+    
+    # Windows locks byte ranges: lock the first byte, retrying because
+    # LK_LOCK gives up with EDEADLOCK after about ten seconds
+    import errno
+    f.seek(0)
+    while True:
+        try:
+            msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+            return
+        except OSError as e:
+            if e.errno != errno.EDEADLOCK:
+                raise
+
+
+def _unlock_file(f):
+    """Release the lock taken by _lock_file()"""
+    try:
+        import msvcrt
+    except ImportError:
+        import fcntl
+        fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+        return
+    
+    f.seek(0)
+    msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+def _copy_file(source, target):
+    """Copy file contents only, in kernel space on Linux"""
+    if not sys.platform.startswith('linux'):
+        # Elsewhere sendfile is missing (Windows) or only writes to sockets
+        # (macOS, BSD); same check as shutil's own sendfile fast path
+        import shutil
+        shutil.copyfile(source, target)
+        return
+    
+    src_fd = os.open(source, os.O_RDONLY)
+    try:
+        dst_fd = os.open(target, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            remaining = os.fstat(src_fd).st_size
+            offset = 0
+            while remaining > 0:
+                sent = os.sendfile(dst_fd, src_fd, offset, remaining)
+                if sent == 0:
+                    break
+                offset += sent
+                remaining -= sent
+        finally:
+            os.close(dst_fd)
+    finally:
+        os.close(src_fd)
+
+
+def _file_sha256(path):
+    """Return the SHA256 hex digest of a file, streamed instead of loaded"""
+    import hashlib
+    
+    with open(path, 'rb') as f:
+        # Python 3.11+ hashes straight from the file in C
+        if hasattr(hashlib, 'file_digest'):
+            return hashlib.file_digest(f, 'sha256').hexdigest()
+        
+        digest = hashlib.sha256()
+        buf = bytearray(1024 * 1024)
+        view = memoryview(buf)
+        while True:
+            n = f.readinto(buf)
+            if not n:
+                break
+            digest.update(view[:n])
+        return digest.hexdigest()
+
+
+def _file_contains(path, needle):
+    """Check whether a file contains needle, stopping at the first hit"""
+    import mmap
+    
+    try:
+        # Search the mapped file in place: only the pages scanned are read
+        with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return mm.find(needle) != -1
+    except (OSError, ValueError):
+        # ValueError: empty files cannot be mapped
+        return False
+
+
+def _file_has_marker(path):
+    """Check whether a file carries any patch marker comment"""
+    import mmap
+    
+    try:
+        with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return _SENTINEL_BYTES_RE.search(mm) is not None
+    except (OSError, ValueError):
+        return False
+
+
 class PyHulaPatcher:
     """
     Patches PyHula installation to fix known issues
     """
     
-    def __init__(self):
+    def __init__(self, verbose=False):
+        self.verbose = verbose
         self.pyhula_path = None
         self.backup_dir = None
+        self._mavlink_path = None
+        self._taskcontroller_path = None
+        self._userapi_path = None
         self.patches_applied = []
+        self._file_cache = {}
+        self._handles = {}
+        self._run_lock = None
+        self._dirty = set()
+        self._local = threading.local()
+        self._log = None
+        self._patched_hashes = {}
+        self._patched_files = set()
         
     def find_pyhula_installation(self):
         """Find the PyHula installation directory"""
@@ -27,10 +268,17 @@ class PyHulaPatcher:
             import pyhula
             pyhula_file = pyhula.__file__
             self.pyhula_path = Path(pyhula_file).parent
-            print(f"Found PyHula at: {self.pyhula_path}")
+            self.backup_dir = self.pyhula_path / "original_backup"
+            
+            # Plain string paths for the files opened on every patch run
+            pyhula_dir = str(self.pyhula_path)
+            self._mavlink_path = os.path.join(pyhula_dir, 'pypack', 'fylo', 'mavlink.py')
+            self._taskcontroller_path = os.path.join(pyhula_dir, 'pypack', 'system', 'taskcontroller.py')
+            self._userapi_path = os.path.join(pyhula_dir, 'userapi.py')
+            self._report(f"Found PyHula at: {self.pyhula_path}")
             return True
         except ImportError:
-            print("PyHula not found. Please install PyHula first.")
+            self._report("PyHula not found. Please install PyHula first.")
             return False
     
     def create_backup(self):
@@ -38,10 +286,9 @@ class PyHulaPatcher:
         if not self.pyhula_path:
             return False
             
-        self.backup_dir = self.pyhula_path / "original_backup"
         if not self.backup_dir.exists():
             self.backup_dir.mkdir()
-            print(f"Created backup directory: {self.backup_dir}")
+            self._report(f"Created backup directory: {self.backup_dir}")
         
         # Backup specific files we'll modify
         files_to_backup = [
@@ -50,245 +297,283 @@ class PyHulaPatcher:
             "userapi.py"
         ]
         
+        import zipfile
+        backup_archive = self.backup_dir / "original.zip"
+        archived = {}
+        if backup_archive.exists():
+            with zipfile.ZipFile(backup_archive) as zf:
+                archived = {name: zf.read(name) for name in zf.namelist()}
+        
+        # Back up an unpatched copy of each file: the installed one (also
+        # after upgrading PyHula), else a per-file backup made by older
+        # versions of this script, else the one already archived
+        originals = {}
         for file_path in files_to_backup:
-            source = self.pyhula_path / file_path
-            if source.exists():
-                backup_dest = self.backup_dir / file_path
-                backup_dest.parent.mkdir(parents=True, exist_ok=True)
-                shutil.copy2(source, backup_dest)
-                print(f"Backed up: {file_path}")
+            for candidate in (self.pyhula_path / file_path, self.backup_dir / file_path):
+                try:
+                    data = candidate.read_bytes()
+                except OSError:
+                    continue
+                if not _SENTINEL_BYTES_RE.search(data):
+                    originals[file_path] = data
+                    break
+            else:
+                data = archived.get(file_path)
+                if data is not None and not _SENTINEL_BYTES_RE.search(data):
+                    originals[file_path] = data
+                else:
+                    self._report(f"⚠ No unpatched copy of {file_path} to back up")
+        
+        if originals == archived:
+            self._report(f"Using existing backup: {backup_archive}")
+            return True
+        
+        # One uncompressed archive instead of a copy per file, swapped in
+        # only once complete so the previous backup survives a failed write
+        partial_archive = self.backup_dir / "original.zip.tmp"
+        with zipfile.ZipFile(partial_archive, 'w', zipfile.ZIP_STORED) as zf:
+            for file_path, data in originals.items():
+                zf.writestr(file_path, data)
+                self._report(f"Backed up: {file_path}")
+        os.replace(str(partial_archive), str(backup_archive))
+        
+        return True
+    
+    def _report(self, message):
+        """Print a message, or collect it for a worker thread or the batched log"""
+        messages = getattr(self._local, 'messages', None)
+        if messages is not None:
+            messages.append(message)
+        elif self._log is not None:
+            self._log.append(message)
+        else:
+            print(message)
+    
+    def _record_patch(self, patch_name):
+        """Record an applied patch, collected per thread like messages"""
+        applied = getattr(self._local, 'applied', None)
+        if applied is not None:
+            applied.append(patch_name)
+        else:
+            self.patches_applied.append(patch_name)
+    
+    def _run_patch(self, patch_func):
+        """Run one patch, returning its result, messages and applied patches"""
+        self._local.messages = []
+        self._local.applied = []
+        try:
+            return patch_func(), self._local.messages, self._local.applied
+        finally:
+            self._local.messages = None
+            self._local.applied = None
+    
+    def _load(self, path):
+        """Return the contents of a PyHula source file, reading it only once"""
+        if path not in self._file_cache:
+            # Keep the handle open: _flush() writes the patch back through it
+            f = open(path, 'r+', encoding='utf-8')
+            self._handles[path] = f
+            self._file_cache[path] = f.read()
+        return self._file_cache[path]
+    
+    def _store(self, path, content):
+        """Stage patched contents; written to disk by _flush()"""
+        import ast
+        
+        # Parse the result once so a broken rewrite never reaches disk
+        try:
+            ast.parse(content, filename=path)
+        except SyntaxError as e:
+            self._report(f"✗ Patched {os.path.basename(path)} is not valid Python: {e}")
+            return False
         
+        self._file_cache[path] = content
+        self._dirty.add(path)
         return True
     
+    def _flush(self):
+        """Write all staged files back to disk"""
+        for path in self._dirty:
+            f = self._handles[path]
+            f.seek(0)
+            f.write(self._file_cache[path])
+            f.truncate()
+        self._dirty.clear()
+        self._close_files()
+    
+    def _close_files(self):
+        """Close the handles opened by _load()"""
+        for f in self._handles.values():
+            f.close()
+        self._handles.clear()
+    
+    def _load_patch_state(self):
+        """Load the hashes recorded after the last successful patch run"""
+        import json
+        
+        state_file = self.backup_dir / "patched.json"
+        try:
+            with open(state_file, 'r', encoding='utf-8') as f:
+                self._patched_hashes = json.load(f)
+        except (OSError, ValueError):
+            self._patched_hashes = {}
+    
+    def _save_patch_state(self):
+        """Record the hashes of all patched files as they are now on disk"""
+        import json
+        
+        for path in self._patched_files:
+            self._patched_hashes[self._state_key(path)] = _file_sha256(path)
+        
+        state_file = self.backup_dir / "patched.json"
+        with open(state_file, 'w', encoding='utf-8') as f:
+            json.dump(self._patched_hashes, f)
+    
+    def _state_key(self, path):
+        """Key of a PyHula file in patched.json: its path relative to the package"""
+        return os.path.relpath(path, str(self.pyhula_path)).replace(os.sep, '/')
+    
+    def _unchanged_since_patch(self, path):
+        """Check whether a file is byte-identical to the last patched version"""
+        recorded = self._patched_hashes.get(self._state_key(path))
+        return recorded is not None and recorded == _file_sha256(path)
+    
     def patch_mavlink_header(self):
         """Patch the MAVLink header packing issue"""
-        mavlink_file = self.pyhula_path / "pypack" / "fylo" / "mavlink.py"
+        mavlink_file = self._mavlink_path
         
-        if not mavlink_file.exists():
-            print(f"MAVLink file not found: {mavlink_file}")
+        if not os.path.exists(mavlink_file):
+            self._report(f"MAVLink file not found: {mavlink_file}")
             return False
         
-        # Read the current file
-        with open(mavlink_file, 'r', encoding='utf-8') as f:
-            content = f.read()
+        # Skip all work when the file is exactly what the last run wrote
+        if self._unchanged_since_patch(mavlink_file):
+            self._report("MAVLink header patch already applied")
+            return True
+        
+        content = self._load(mavlink_file)
         
         # Check if already patched
-        if "# PYHULA_PATCH_APPLIED" in content:
-            print("MAVLink header patch already applied")
+        if _SENTINEL_RE.search(content):
+            self._report("MAVLink header patch already applied")
+            self._patched_files.add(mavlink_file)
             return True
         
-        # Find and replace the problematic pack method
-        original_pack_pattern = '''    def pack(self, force_mavlink1=False):
-        """
-        pack the MAVLink header into a byte string
-        """
-        '''
-        
-        fixed_pack_code = '''    def pack(self, force_mavlink1=False):
-        """
-        pack the MAVLink header into a byte string
-        """
-        # PYHULA_PATCH_APPLIED: Fix struct packing with proper integer conversion
-        try:
-            # Ensure all values are proper integers
-            magic = int(self.magic) if hasattr(self, 'magic') else 254
-            length = int(self.length) if hasattr(self, 'length') else 0
-            seq = int(self.seq) if hasattr(self, 'seq') else 0
-            srcSystem = int(self.srcSystem) if hasattr(self, 'srcSystem') else 255
-            srcComponent = int(self.srcComponent) if hasattr(self, 'srcComponent') else 190
-            msgId = int(self.msgId) if hasattr(self, 'msgId') else 0
-            
-            return struct.pack('<BBBBBB', magic, length, seq, srcSystem, srcComponent, msgId)
-        except (ValueError, TypeError) as e:
-            # Fallback with default values if conversion fails
-            print(f"MAVLink header pack warning: {e}, using defaults")
-            return struct.pack('<BBBBBB', 254, 0, 0, 255, 190, 0)
-        '''
-        
-        # Apply the patch
-        if original_pack_pattern in content:
-            # Find the complete method and replace it
-            lines = content.split('\n')
-            new_lines = []
-            in_pack_method = False
-            indent_level = 0
-            
-            for line in lines:
-                if 'def pack(self, force_mavlink1=False):' in line:
-                    in_pack_method = True
-                    indent_level = len(line) - len(line.lstrip())
-                    # Add our fixed method
-                    new_lines.extend(fixed_pack_code.split('\n'))
-                    continue
-                
-                if in_pack_method:
-                    current_indent = len(line) - len(line.lstrip())
-                    if line.strip() and current_indent <= indent_level and not line.strip().startswith('"""'):
-                        # End of method reached
-                        in_pack_method = False
-                        new_lines.append(line)
-                    # Skip original method lines
-                    continue
-                else:
-                    new_lines.append(line)
-            
-            # Write the patched file
-            patched_content = '\n'.join(new_lines)
-            with open(mavlink_file, 'w', encoding='utf-8') as f:
-                f.write(patched_content)
-            
-            print("✓ Applied MAVLink header struct packing fix")
-            self.patches_applied.append("mavlink_header_fix")
-            return True
-        else:
-            print("Could not find MAVLink pack method pattern to patch")
+        # Replace the complete method in one pass
+        content = _replace_method(_PACK_SIGNATURE, _PACK_METHOD_RE, _MAVLINK_PACK_REPLACEMENT, content)
+        
+        if content is None:
+            self._report("Could not find MAVLink pack method pattern to patch")
+            return False
+        
+        if not self._store(mavlink_file, content):
             return False
+        self._patched_files.add(mavlink_file)
+        
+        self._report("✓ Applied MAVLink header struct packing fix")
+        self._record_patch("mavlink_header_fix")
+        return True
     
     def patch_udp_binding(self):
         """Patch UDP binding issues in task controller"""
-        taskcontroller_file = self.pyhula_path / "pypack" / "system" / "taskcontroller.py"
+        taskcontroller_file = self._taskcontroller_path
         
-        if not taskcontroller_file.exists():
-            print(f"TaskController file not found: {taskcontroller_file}")
+        if not os.path.exists(taskcontroller_file):
+            self._report(f"TaskController file not found: {taskcontroller_file}")
             return False
         
-        # Read the current file
-        with open(taskcontroller_file, 'r', encoding='utf-8') as f:
-            content = f.read()
+        # Skip all work when the file is exactly what the last run wrote
+        if self._unchanged_since_patch(taskcontroller_file):
+            self._report("UDP binding patch already applied")
+            return True
+        
+        content = self._load(taskcontroller_file)
         
         # Check if already patched
-        if "# PYHULA_UDP_PATCH_APPLIED" in content:
-            print("UDP binding patch already applied")
+        if _SENTINEL_RE.search(content):
+            self._report("UDP binding patch already applied")
+            self._patched_files.add(taskcontroller_file)
             return True
         
-        # Find UDP binding code and make it more robust
-        udp_bind_patterns = [
-            "self.sock.bind(('', self.listen_port))",
-            "self.sock.bind((\"\", self.listen_port))",
-            "sock.bind(('', port))",
-            "sock.bind((\"\", port))"
-        ]
+        # Wrap every matching bind call in a single pass
+        content, count = _BIND_RE.subn(
+            lambda m: _indent_block(_UDP_BIND_REPLACEMENT.format_map(m.groupdict()), m.group('indent')),
+            content)
         
-        patched = False
-        for pattern in udp_bind_patterns:
-            if pattern in content:
-                # Replace with more robust binding
-                robust_bind = f"""# PYHULA_UDP_PATCH_APPLIED: Robust UDP binding
-        try:
-            {pattern}
-        except OSError as e:
-            if e.winerror == 10049:  # Address not valid
-                # Try binding to localhost instead
-                try:
-                    self.sock.bind(('127.0.0.1', self.listen_port))
-                    print(f"UDP bound to localhost:{{self.listen_port}} (fallback)")
-                except:
-                    # Try any available port
-                    self.sock.bind(('127.0.0.1', 0))
-                    print(f"UDP bound to localhost:{{self.sock.getsockname()[1]}} (auto-assigned)")
-            else:
-                raise e"""
-                
-                content = content.replace(pattern, robust_bind)
-                patched = True
-                break
+        if not count:
+            self._report("Could not find UDP binding pattern to patch")
+            return False
         
-        if patched:
-            # Write the patched file
-            with open(taskcontroller_file, 'w', encoding='utf-8') as f:
-                f.write(content)
-            
-            print("✓ Applied UDP binding robustness fix")
-            self.patches_applied.append("udp_binding_fix")
-            return True
-        else:
-            print("Could not find UDP binding pattern to patch")
+        if not self._store(taskcontroller_file, content):
             return False
+        self._patched_files.add(taskcontroller_file)
+        
+        self._report("✓ Applied UDP binding robustness fix")
+        self._record_patch("udp_binding_fix")
+        return True
     
     def patch_userapi_connection(self):
         """Patch UserApi to handle connection issues gracefully"""
-        userapi_file = self.pyhula_path / "userapi.py"
+        userapi_file = self._userapi_path
         
-        if not userapi_file.exists():
-            print(f"UserApi file not found: {userapi_file}")
+        if not os.path.exists(userapi_file):
+            self._report(f"UserApi file not found: {userapi_file}")
             return False
         
-        # Read the current file
-        with open(userapi_file, 'r', encoding='utf-8') as f:
-            content = f.read()
+        # Skip all work when the file is exactly what the last run wrote
+        if self._unchanged_since_patch(userapi_file):
+            self._report("UserApi connection patch already applied")
+            return True
+        
+        content = self._load(userapi_file)
         
         # Check if already patched
-        if "# PYHULA_USERAPI_PATCH_APPLIED" in content:
-            print("UserApi connection patch already applied")
+        if _SENTINEL_RE.search(content):
+            self._report("UserApi connection patch already applied")
+            self._patched_files.add(userapi_file)
             return True
         
-        # Find connect method and make it more robust
-        connect_pattern = "def connect(self, server_ip=\"192.168.100.1\"):"
+        # Replace the method
+        content = _replace_method(_CONNECT_SIGNATURE, _CONNECT_METHOD_RE, _USERAPI_CONNECT_REPLACEMENT, content)
         
-        if connect_pattern in content:
-            # Add robust connection handling
-            robust_connect = '''def connect(self, server_ip="192.168.100.1"):
-        """
-        connect to the drone with robust error handling
-        """
-        # PYHULA_USERAPI_PATCH_APPLIED
-        try:
-            print(f"Connecting to drone at {server_ip}...")
-            result = self._control_server.connect(server_ip)
-            if result:
-                print("✓ Connection established")
-            else:
-                print("✗ Connection failed - no response from drone")
-            return result
-        except Exception as e:
-            print(f"✗ Connection error: {e}")
-            print("Troubleshooting:")
-            print(f"1. Verify drone is at IP: {server_ip}")
-            print("2. Check WiFi connection to drone network")
-            print("3. Ensure drone is powered and in AP mode")
-            return False'''
-            
-            # Replace the method
-            lines = content.split('\n')
-            new_lines = []
-            in_connect_method = False
-            indent_level = 0
-            
-            for line in lines:
-                if connect_pattern in line:
-                    in_connect_method = True
-                    indent_level = len(line) - len(line.lstrip())
-                    # Add our fixed method
-                    for robust_line in robust_connect.split('\n'):
-                        new_lines.append(' ' * indent_level + robust_line if robust_line.strip() else '')
-                    continue
-                
-                if in_connect_method:
-                    current_indent = len(line) - len(line.lstrip())
-                    if line.strip() and current_indent <= indent_level and line.strip().startswith('def '):
-                        # Next method reached
-                        in_connect_method = False
-                        new_lines.append(line)
-                    # Skip original method lines
-                    continue
-                else:
-                    new_lines.append(line)
-            
-            # Write the patched file
-            patched_content = '\n'.join(new_lines)
-            with open(userapi_file, 'w', encoding='utf-8') as f:
-                f.write(patched_content)
-            
-            print("✓ Applied UserApi connection robustness fix")
-            self.patches_applied.append("userapi_connection_fix")
-            return True
-        else:
-            print("Could not find UserApi connect method to patch")
+        if content is None:
+            self._report("Could not find UserApi connect method to patch")
+            return False
+        
+        if not self._store(userapi_file, content):
             return False
+        self._patched_files.add(userapi_file)
+        
+        self._report("✓ Applied UserApi connection robustness fix")
+        self._record_patch("userapi_connection_fix")
+        return True
     
-    def verify_patches(self):
+    def verify_patches(self, deep=False):
         """Verify that patches were applied successfully"""
-        print("\nVerifying patches...")
+        self._report("\nVerifying patches...")
+        
+        if not self.pyhula_path:
+            return False
+        
+        # Cheap check: every patched file carries its marker comment
+        patched_files = [
+            ("pypack/fylo/mavlink.py", b"# PYHULA_PATCH_APPLIED"),
+            ("pypack/system/taskcontroller.py", b"# PYHULA_UDP_PATCH_APPLIED"),
+            ("userapi.py", b"# PYHULA_USERAPI_PATCH_APPLIED")
+        ]
+        
+        all_found = True
+        for file_path, sentinel in patched_files:
+            if _file_contains(self.pyhula_path / file_path, sentinel):
+                self._report(f"✓ Patch marker found: {file_path}")
+            else:
+                self._report(f"✗ Patch marker missing: {file_path}")
+                all_found = False
+        
+        if not deep:
+            return all_found
+        
+        import importlib
         
         try:
             # Reload PyHula to test patches
@@ -298,27 +583,52 @@ class PyHulaPatcher:
             import pyhula
             api = pyhula.UserApi()
             
-            print("✓ PyHula reloaded successfully with patches")
-            return True
+            self._report("✓ PyHula reloaded successfully with patches")
+            return all_found
             
         except Exception as e:
-            print(f"✗ Patch verification failed: {e}")
+            self._report(f"✗ Patch verification failed: {e}")
             return False
     
     def apply_all_patches(self):
         """Apply all available patches"""
-        print("PyHula Patcher - Applying Fixes")
-        print("=" * 40)
+        # Collect output and write it once at the end, unless streaming
+        if not self.verbose:
+            self._log = []
+        try:
+            return self._apply_all_patches()
+        finally:
+            self._close_files()
+            if self._run_lock is not None:
+                _unlock_file(self._run_lock)
+                self._run_lock.close()
+                self._run_lock = None
+            if self._log is not None:
+                sys.stdout.write('\n'.join(self._log) + '\n')
+                self._log = None
+    
+    def _apply_all_patches(self):
+        from concurrent.futures import ThreadPoolExecutor
+        
+        self._report("PyHula Patcher - Applying Fixes")
+        self._report("=" * 40)
         
         # Find PyHula installation
         if not self.find_pyhula_installation():
             return False
         
+        # One patch run at a time per installation; a second run waits here
+        self.backup_dir.mkdir(exist_ok=True)
+        self._run_lock = open(self.backup_dir / "patcher.lock", 'a')
+        _lock_file(self._run_lock)
+        
         # Create backup
         if not self.create_backup():
-            print("Failed to create backup")
+            self._report("Failed to create backup")
             return False
         
+        self._load_patch_state()
+        
         # Apply patches
         patches = [
             ("MAVLink Header Fix", self.patch_mavlink_header),
@@ -326,52 +636,83 @@ class PyHulaPatcher:
             ("UserApi Connection Fix", self.patch_userapi_connection)
         ]
         
+        # Each patch touches a different file, so their I/O can overlap
         success_count = 0
-        for name, patch_func in patches:
-            print(f"\nApplying {name}...")
-            if patch_func():
-                success_count += 1
-            else:
-                print(f"✗ Failed to apply {name}")
+        with ThreadPoolExecutor(max_workers=len(patches)) as executor:
+            futures = [(name, executor.submit(self._run_patch, patch_func))
+                       for name, patch_func in patches]
+            
+            # Report in the original order so output does not interleave
+            for name, future in futures:
+                self._report(f"\nApplying {name}...")
+                result, messages, applied = future.result()
+                for message in messages:
+                    self._report(message)
+                self.patches_applied.extend(applied)
+                if result:
+                    success_count += 1
+                else:
+                    self._report(f"✗ Failed to apply {name}")
+        
+        # Write patched files back in one pass
+        self._flush()
+        self._save_patch_state()
         
         # Verify patches
         if success_count > 0:
             self.verify_patches()
         
-        print(f"\n" + "=" * 40)
-        print(f"Patch Summary: {success_count}/{len(patches)} patches applied")
-        print(f"Applied patches: {', '.join(self.patches_applied)}")
+        self._report(f"\n" + "=" * 40)
+        self._report(f"Patch Summary: {success_count}/{len(patches)} patches applied")
+        self._report(f"Applied patches: {', '.join(self.patches_applied)}")
         
         if success_count == len(patches):
-            print("✓ All patches applied successfully!")
-            print("\nPyHula should now work more reliably.")
+            self._report("✓ All patches applied successfully!")
+            self._report("\nPyHula should now work more reliably.")
         else:
-            print("⚠ Some patches failed. PyHula may still have issues.")
+            self._report("⚠ Some patches failed. PyHula may still have issues.")
         
-        print(f"\nBackup directory: {self.backup_dir}")
-        print("You can restore original files from this backup if needed.")
+        self._report(f"\nBackup directory: {self.backup_dir}")
+        self._report("You can restore original files from this backup if needed.")
         
         return success_count > 0
     
     def restore_backup(self):
         """Restore original files from backup"""
         if not self.backup_dir or not self.backup_dir.exists():
-            print("No backup directory found")
+            self._report("No backup directory found")
             return False
         
-        print("Restoring original PyHula files...")
-        
-        # Find all backed up files
-        for backup_file in self.backup_dir.rglob("*.py"):
-            relative_path = backup_file.relative_to(self.backup_dir)
+        self._report("Restoring original PyHula files...")
+        
+        restored = set()
+        backup_archive = self.backup_dir / "original.zip"
+        if backup_archive.exists():
+            import zipfile
+            with zipfile.ZipFile(backup_archive) as zf:
+                for relative_path in zf.namelist():
+                    data = zf.read(relative_path)
+                    # Archives from older versions of this script may hold patched copies
+                    if _SENTINEL_BYTES_RE.search(data):
+                        continue
+                    target_file = self.pyhula_path / relative_path
+                    target_file.parent.mkdir(parents=True, exist_ok=True)
+                    target_file.write_bytes(data)
+                    restored.add(relative_path)
+                    self._report(f"Restored: {relative_path}")
+        
+        # Backups made before the archive format: one copy per file
+        for relative_path, backup_file in _scan_py_files(self.backup_dir):
+            if relative_path.replace(os.sep, '/') in restored or _file_has_marker(backup_file):
+                continue
             target_file = self.pyhula_path / relative_path
             
-            # Restore the file
+            # Restore the file contents; metadata of the backup is irrelevant
             target_file.parent.mkdir(parents=True, exist_ok=True)
-            shutil.copy2(backup_file, target_file)
-            print(f"Restored: {relative_path}")
+            _copy_file(backup_file, target_file)
+            self._report(f"Restored: {relative_path}")
         
-        print("✓ Original files restored")
+        self._report("✓ Original files restored")
         return True
 
 def main():
@@ -381,17 +722,20 @@ def main():
     parser.add_argument('--patch', action='store_true', help='Apply all patches')
     parser.add_argument('--restore', action='store_true', help='Restore original files')
     parser.add_argument('--verify', action='store_true', help='Verify current installation')
+    parser.add_argument('--verbose', action='store_true', help='Stream progress messages as they happen')
+    parser.add_argument('--deep-verify', action='store_true',
+                        help='Verify by reloading PyHula (slower, imports the full library)')
     
     args = parser.parse_args()
     
-    patcher = PyHulaPatcher()
+    patcher = PyHulaPatcher(verbose=args.verbose)
     
     if args.restore:
         patcher.find_pyhula_installation()
         patcher.restore_backup()
-    elif args.verify:
+    elif args.verify or args.deep_verify:
         patcher.find_pyhula_installation()
-        patcher.verify_patches()
+        patcher.verify_patches(deep=args.deep_verify)
     else:
         # Default: apply patches
         patcher.apply_all_patches()
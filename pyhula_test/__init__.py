@@ -0,0 +1,119 @@
+"""
+PyHula Installation Test
+Tests if PyHula is properly installed and working.
+
+The checks live in submodules that are only imported when first used, so
+importing this package for a single check skips the rest.
+"""
+
+import sys
+from typing import TYPE_CHECKING
+
+__all__ = [
+    "print_header",
+    "test_python_version",
+    "test_essential_packages",
+    "test_pyhula_import",
+    "test_environment_info",
+    "create_simple_test",
+    "main",
+]
+
+# Public name -> submodule defining it
+_SUBMODULES = {
+    "print_header": "._checks",
+    "test_python_version": "._checks",
+    "test_essential_packages": "._checks",
+    "test_pyhula_import": "._checks",
+    "test_environment_info": "._env",
+    "create_simple_test": "._templates",
+}
+
+if TYPE_CHECKING:
+    from ._checks import (print_header, test_python_version,
+                          test_essential_packages, test_pyhula_import)
+    from ._env import test_environment_info
+    from ._templates import create_simple_test
+
+def __getattr__(name):
+    """Import the submodule defining name on first access (PEP 562)"""
+    module_name = _SUBMODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    
+    from importlib import import_module
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+if sys.version_info < (3, 7):
+    # Module __getattr__ needs Python 3.7+; PyHula's Python 3.6 imports eagerly
+    from ._checks import (print_header, test_python_version,
+                          test_essential_packages, test_pyhula_import)
+    from ._env import test_environment_info
+    from ._templates import create_simple_test
+
+# Test result -> (symbol, label) for the summary
+_STATUS = {True: ("✓", "PASS"), False: ("✗", "FAIL")}
+
+def main():
+    """Main test function"""
+    import argparse
+    from datetime import datetime
+    from ._checks import (print_header, test_python_version,
+                          test_essential_packages, test_pyhula_import)
+    from ._env import test_environment_info
+    from ._templates import create_simple_test
+    
+    parser = argparse.ArgumentParser(description="PyHula Installation Test")
+    parser.add_argument('--only-check', action='store_true',
+                        help='Only run the pass/fail checks (no environment info or example files)')
+    args = parser.parse_args()
+    
+    print("PyHula Installation Test")
+    print(f"Test started at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+    
+    tests = [
+        ("Python Version", test_python_version),
+        ("Essential Packages", test_essential_packages),
+        ("PyHula Library", test_pyhula_import),
+    ]
+    
+    test_results = {}
+    for test_name, test_func in tests:
+        test_results[test_name] = test_func()
+        
+        # Without Python 3.6 the remaining (import-heavy) tests cannot pass
+        if not test_results["Python Version"]:
+            print("\nSkipping remaining tests: PyHula requires Python 3.6")
+            break
+    
+    if not args.only_check:
+        test_environment_info()
+        
+        # Create example (if PyHula works)
+        if test_results.get("PyHula Library"):
+            create_simple_test()
+    
+    # Summary
+    print_header("Test Summary")
+    for test_name, result in test_results.items():
+        symbol, status = _STATUS[result]
+        print(f"{symbol} {test_name:<20} - {status}")
+    all_passed = all(test_results.values())
+    
+    print("\nOverall Result:")
+    if all_passed:
+        print("✅ ALL TESTS PASSED - PyHula environment is ready!")
+        print("\nNext steps:")
+        print("1. Edit and run 'test_pyhula_basic.py' to get started")
+        print("2. Create your own PyHula scripts")
+        print("3. Use 'jupyter notebook' for interactive development")
+    else:
+        print("❌ SOME TESTS FAILED - Please check the installation")
+        print("\nTroubleshooting:")
+        print("1. Make sure you activated the PyHula environment")
+        print("2. Re-run the installation script")
+        print("3. Check the README.md for troubleshooting tips")
+    
+    sys.exit(0 if all_passed else 1)
@@ -0,0 +1,97 @@
+"""
+PyHula installation checks: Python version, essential packages and the
+PyHula library itself.
+"""
+
+import sys
+from importlib.util import find_spec
+
+_HEADER_SEP = "\n" + "=" * 50
+
+def print_header(title):
+    """Print a formatted header"""
+    # One write instead of three prints
+    sys.stdout.write(f"{_HEADER_SEP}\n  {title}{_HEADER_SEP}\n")
+
+def test_python_version():
+    """Test if we're running Python 3.6"""
+    print_header("Python Version Test")
+    print(f"Python version: {sys.version}")
+    
+    if sys.version_info[:2] == (3, 6):
+        print("✓ Python 3.6 detected - Correct version for PyHula")
+        return True
+    else:
+        print("✗ Warning: Not running Python 3.6")
+        print("  PyHula requires Python 3.6 specifically")
+        return False
+
+def test_essential_packages():
+    """Test if essential packages are available"""
+    print_header("Essential Packages Test")
+    
+    # (package, importable module, description); "jupyter" is a metapackage
+    # without a module of its own, so probe jupyter_core instead
+    packages = [
+        ("numpy", "numpy", "Scientific computing"),
+        ("matplotlib", "matplotlib", "Plotting and visualization"),
+        ("jupyter", "jupyter_core", "Interactive notebooks"),
+        ("cython", "cython", "C extensions for Python")
+    ]
+    
+    all_good = True
+    for package_name, module_name, description in packages:
+        # Already loaded (e.g. inside Jupyter), or locatable without executing it
+        if module_name in sys.modules or find_spec(module_name) is not None:
+            print(f"✓ {package_name:<12} - {description}")
+        else:
+            print(f"✗ {package_name:<12} - NOT FOUND")
+            all_good = False
+    
+    return all_good
+
+def test_pyhula_import():
+    """Test PyHula import and basic functionality"""
+    print_header("PyHula Library Test")
+    
+    try:
+        import pyhula
+        print("✓ PyHula import successful")
+        
+        # Try to get version using the official method
+        try:
+            version = pyhula.get_version()
+            print(f"  Version: {version.strip()}")
+        except AttributeError as e:
+            # Older PyHula builds have no get_version()
+            print(f"  Version: Could not retrieve ({e})")
+            
+        # Test UserApi class creation
+        try:
+            api = pyhula.UserApi()
+            print("✓ UserApi instance created successfully")
+            print("  Ready for drone connection and control")
+        except Exception as e:
+            # The constructor may fail in many ways; name the exception type
+            print(f"✗ UserApi creation failed ({type(e).__name__}): {e}")
+            return False
+            
+        # Check available attributes/functions
+        pyhula_attrs = [attr for attr in dir(pyhula) if attr[0] != '_']
+        print(f"  Available functions/classes: {len(pyhula_attrs)}")
+        
+        if pyhula_attrs:
+            print("  Main components:")
+            print("    - " + "\n    - ".join(pyhula_attrs))
+        
+        return True
+        
+    except ImportError as e:
+        # ImportError, not ModuleNotFoundError (3.6+ only): also covers a
+        # PyHula that is installed but fails to load its own dependencies
+        print(f"✗ PyHula import failed: {e}")
+        print("  Make sure you're running this script in the activated PyHula environment")
+        return False
+    except Exception as e:
+        print(f"✗ PyHula error: {e}")
+        return False
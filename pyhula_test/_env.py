@@ -0,0 +1,31 @@
+"""
+Environment information for the PyHula installation test.
+"""
+
+import sys
+import os
+
+from ._checks import print_header
+
+def test_environment_info():
+    """Display environment information"""
+    print_header("Environment Information")
+    
+    print(f"Script location: {os.path.abspath(sys.argv[0])}")
+    print(f"Working directory: {os.getcwd()}")
+    print(f"Python executable: {sys.executable}")
+    print(f"Python path: {sys.path[0]}")
+    
+    # Check if we're in a virtual environment: activate scripts set
+    # VIRTUAL_ENV, and a venv interpreter always has prefix != base_prefix
+    virtual_env = os.environ.get('VIRTUAL_ENV')
+    if sys.prefix != sys.base_prefix:
+        print("✓ Running in virtual environment")
+        print(f"  Virtual env path: {sys.prefix}")
+    elif virtual_env:
+        print("? VIRTUAL_ENV is set, but this Python is not the environment's interpreter")
+    else:
+        print("? Not clearly in a virtual environment")
+    
+    if virtual_env:
+        print(f"  VIRTUAL_ENV: {virtual_env}")
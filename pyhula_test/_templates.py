@@ -0,0 +1,75 @@
+"""
+Example files written next to the user's scripts once PyHula works.
+"""
+
+import pathlib
+
+from ._checks import print_header
+
+def _read_template(name):
+    """Read a template bundled with this package, also from a zip archive"""
+    try:
+        from importlib.resources import files
+    except ImportError:
+        # Python < 3.9 (PyHula's 3.6): get_data returns raw bytes, so
+        # normalize line endings like a text-mode read would
+        import pkgutil
+        data = pkgutil.get_data(__package__, "templates/" + name)
+        return data.decode("utf-8").replace("\r\n", "\n")
+    
+    return files(__package__).joinpath("templates").joinpath(name).read_text(encoding="utf-8")
+
+def _write_if_changed(path, content):
+    """Write content to path unless the file already holds it; return True if written"""
+    path = pathlib.Path(path)
+    try:
+        if path.read_text(encoding="utf-8") == content:
+            return False
+    except (OSError, UnicodeDecodeError):
+        pass
+    
+    path.write_text(content, encoding="utf-8")
+    return True
+
+def create_simple_test():
+    """Create comprehensive PyHula usage examples (caller checks PyHula works)"""
+    print_header("Creating PyHula Example Files")
+    
+    # Write all example files; re-runs leave up-to-date files untouched
+    files_created = []
+    files_unchanged = []
+    
+    try:
+        # Example file contents live in templates/ inside this package
+        example_files = [
+            ('pyhula_comprehensive_tutorial.py', _read_template("pyhula_comprehensive_tutorial.py.tmpl")),
+            ('pyhula_basic_examples.py', _read_template("pyhula_basic_examples.py.tmpl")),
+            ('network_setup_guide.md', _read_template("network_setup_guide.md"))
+        ]
+        
+        for file_name, content in example_files:
+            if _write_if_changed(file_name, content):
+                files_created.append(file_name)
+            else:
+                files_unchanged.append(file_name)
+        
+        if files_created:
+            print("✓ Created comprehensive PyHula example files:")
+            for file in files_created:
+                print(f"  - {file}")
+        if files_unchanged:
+            print("✓ PyHula example files already up to date:")
+            for file in files_unchanged:
+                print(f"  - {file}")
+        
+        print("\nFile descriptions:")
+        print("  • pyhula_comprehensive_tutorial.py - Complete flight demonstration")
+        print("  • pyhula_basic_examples.py - Individual feature examples")
+        print("  • network_setup_guide.md - WiFi and connection setup guide")
+        
+    except Exception as e:
+        print(f"✗ Could not create some files: {e}")
+        if files_created:
+            print(f"  Successfully created: {', '.join(files_created)}")
+        if files_unchanged:
+            print(f"  Already up to date: {', '.join(files_unchanged)}")